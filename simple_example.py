@@ -3,6 +3,8 @@ Simple TensorTrade Example - Component System Demo
 This demonstrates the Component and TradingContext pattern.
 """
 
+import contextlib
+import io
 import sys
 import os
 
@@ -12,12 +14,11 @@ sys.path.insert(0, os.path.dirname(__file__))
 from tensortrade.core import Component, TradingContext
 
 
-from tensortrade.core import Component, TradingContext
-
-
 class SimpleStrategy(Component):
     """A simple trading strategy component"""
     
+    __slots__ = ('name', 'max_position', 'risk_level')
+
     registered_name = "strategy"
     
     def __init__(self, name: str):
@@ -90,25 +91,35 @@ def demo_component_system():
     print("-" * 70)
     print("Running: pytest tests/tensortrade/unit/base/test_component.py ...")
     
-    import subprocess
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", 
-         "tests/tensortrade/unit/base/test_component.py",
-         "-v", "--tb=line", "-q"],
-        capture_output=True,
-        text=True,
-        cwd=os.path.dirname(__file__)
-    )
-    
+    import pytest
+
+    class PassedCounter:
+        """Counts the tests that pass while pytest runs in this process."""
+
+        def __init__(self):
+            self.passed = 0
+
+        def pytest_runtest_logreport(self, report):
+            if report.when == "call" and report.passed:
+                self.passed += 1
+
+    # Run pytest in this process so the interpreter and the already imported
+    # tensortrade modules are reused instead of paying for a fresh startup.
+    counter = PassedCounter()
+    output = io.StringIO()
+    test_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "tests", "tensortrade", "unit", "base", "test_component.py")
+    with contextlib.redirect_stdout(output):
+        returncode = pytest.main([test_path, "-v", "--tb=line", "-q"], plugins=[counter])
+
     # Show test output
-    if result.returncode == 0:
+    if returncode == 0:
         print("✅ All tests passed!")
-        # Count passed tests
-        passed = result.stdout.count("PASSED")
-        print(f"   {passed} tests passed successfully")
+        print(f"   {counter.passed} tests passed successfully")
     else:
         print("❌ Some tests failed")
-        print(result.stdout[-500:] if len(result.stdout) > 500 else result.stdout)
+        stdout = output.getvalue()
+        print(stdout[-500:] if len(stdout) > 500 else stdout)
     
     return True
 
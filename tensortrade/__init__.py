@@ -1,4 +1,6 @@
 
+import importlib
+
 from . import core
 from . import data
 from . import feed
@@ -11,6 +13,12 @@ from tensortrade.oms import (
 )
 from . import env
 from . import stochastic
-from . import agents
 
 from .version import __version__
+
+
+def __getattr__(name: str):
+    # The agents pull in TensorFlow, so they are only imported on first use.
+    if name == "agents":
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -109,7 +109,7 @@ class A2CAgent(Agent):
         rand = random.random()
 
         if rand < threshold:
-            return np.random.choice(self.n_actions)
+            return np.random.randint(self.n_actions)
         else:
             logits = self.actor_network(state[None, :], training=False)
             return tf.squeeze(tf.squeeze(tf.random.categorical(logits, 1), axis=-1), axis=-1)
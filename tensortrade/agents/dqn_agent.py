@@ -245,7 +245,7 @@ class DQNAgent(Agent):
         rand = random.random()
 
         if rand < threshold:
-            return np.random.choice(self.n_actions)
+            return np.random.randint(self.n_actions)
         else:
             return np.argmax(self.policy_network(np.expand_dims(state, 0)))
 
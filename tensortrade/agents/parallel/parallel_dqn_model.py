@@ -73,7 +73,7 @@ class ParallelDQNModel:
         rand = random.random()
 
         if rand < threshold:
-            return np.random.choice(self.n_actions)
+            return np.random.randint(self.n_actions)
         else:
             return np.argmax(self.policy_network(np.expand_dims(state, 0)))
 
@@ -21,6 +21,8 @@ class Identifiable(object, metaclass=ABCMeta):
     """Identifiable mixin for adding a unique `id` property to instances of a class.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         """Gets the identifier for the object.
@@ -48,6 +48,8 @@ class ContextualizedMixin(object):
     contextual setting.
     """
 
+    __slots__ = ()
+
     @property
     def context(self) -> Context:
         """Gets the `Context` the object is under.
@@ -87,6 +89,8 @@ class Component(ABC, ContextualizedMixin, Identifiable, metaclass=InitContextMet
         and passed to a `TradingContext`.
     """
 
+    __slots__ = ('_context', '_id')
+
     registered_name = None
 
     def __init_subclass__(cls, **kwargs) -> None:
@@ -3,9 +3,7 @@ import json
 import yaml
 
 from collections import UserDict
-from typing import List
-
-import numpy as np
+from typing import Any, List
 
 from . import registry
 
@@ -47,8 +45,7 @@ class TradingContext(UserDict):
     def __init__(self, config: dict):
         super().__init__(**config)
 
-        r = registry.registry()
-        registered_names = list(np.unique([r[i] for i in r.keys()]))
+        registered_names = set(registry.registry().values())
 
         for name in registered_names:
             if name not in registry.MAJOR_COMPONENTS:
@@ -174,8 +171,14 @@ class Context(UserDict):
     """
 
     def __init__(self, **kwargs):
-        super(Context, self).__init__(**kwargs)
-        self.__dict__ = {**self.__dict__, **self.data}
+        # `kwargs` is already a fresh dict, so it is used as the underlying
+        # data directly instead of being copied in key by key through
+        # `UserDict.update`.
+        self.data = kwargs
+        self.__dict__.update(self.data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
 
     def __str__(self):
         data = ['{}={}'.format(k, getattr(self, k)) for k in self.__slots__]
@@ -14,20 +14,60 @@ class CryptoDataDownload:
     """Provides methods for retrieving data on different cryptocurrencies from
     https://www.cryptodatadownload.com/cdd/.
 
+    Parameters
+    ----------
+    cache : bool, default False
+        Whether to keep downloaded files in memory and reuse them when the same
+        pair and timeframe is fetched again. Cached files are never refreshed,
+        use `clear_cache` to download the latest data.
+
     Attributes
     ----------
     url : str
         The url for collecting data from CryptoDataDownload.
+    cache : bool
+        Whether downloaded files are kept in memory and reused.
 
     Methods
     -------
     fetch(exchange_name,base_symbol,quote_symbol,timeframe,include_all_volumes=False)
         Fetches data for different exchanges and cryptocurrency pairs.
+    clear_cache()
+        Removes all downloaded files kept in memory.
 
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: bool = False) -> None:
         self.url = "https://www.cryptodatadownload.com/cdd/"
+        self.cache = cache
+        self._cache = {}
+
+    def _read_csv(self, filename: str) -> pd.DataFrame:
+        """Downloads a csv file, reusing an earlier download if caching is on.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the file to download.
+
+        Returns
+        -------
+        `pd.DataFrame`
+            The raw contents of the csv file. The cached data frame is shared,
+            so it must not be modified in place.
+        """
+        url = self.url + filename
+
+        if not self.cache:
+            return pd.read_csv(url, skiprows=1)
+
+        if url not in self._cache:
+            self._cache[url] = pd.read_csv(url, skiprows=1)
+        return self._cache[url]
+
+    def clear_cache(self) -> None:
+        """Removes all downloaded files kept in memory."""
+        self._cache = {}
 
     def fetch_default(self,
                       exchange_name: str,
@@ -63,7 +103,7 @@ class CryptoDataDownload:
         quote_vc = "Volume {}".format(quote_symbol)
         new_quote_vc = "volume_quote"
 
-        df = pd.read_csv(self.url + filename, skiprows=1)
+        df = self._read_csv(filename)
         df = df[::-1]
         df = df.drop(["symbol"], axis=1)
         df = df.rename({base_vc: new_base_vc, quote_vc: new_quote_vc, "Date": "date"}, axis=1)
@@ -108,7 +148,7 @@ class CryptoDataDownload:
         if timeframe.endswith("h"):
             timeframe = timeframe[:-1] + "hr"
         filename = "{}_{}{}_{}.csv".format("gemini", quote_symbol, base_symbol, timeframe)
-        df = pd.read_csv(self.url + filename, skiprows=1)
+        df = self._read_csv(filename)
         df = df[::-1]
         df = df.drop(["Symbol", "Unix Timestamp"], axis=1)
         df.columns = [name.lower() for name in df.columns]
@@ -124,6 +164,10 @@ class CryptoDataDownload:
               include_all_volumes: bool = False) -> pd.DataFrame:
         """Fetches data for different exchanges and cryptocurrency pairs.
 
+        If the instance was created with `cache=True`, a pair and timeframe
+        that was fetched before is served from memory without downloading it
+        again.
+
         Parameters
         ----------
         exchange_name : str
@@ -90,7 +90,7 @@ class TensorTradeActionScheme(ActionScheme):
 
         for order in orders:
             if order:
-                logging.info('Step {}: {} {}'.format(order.step, order.side, order.quantity))
+                logging.info('Step %s: %s %s', order.step, order.side, order.quantity)
                 self.broker.submit(order)
 
         self.broker.update()
@@ -149,23 +149,25 @@ class BSH(TensorTradeActionScheme):
         self.listeners += [listener]
         return self
 
-    def get_orders(self, action: int, portfolio: 'Portfolio') -> 'Order':
-        order = None
+    def get_orders(self, action: int, portfolio: 'Portfolio') -> 'List[Order]':
+        orders = []
 
-        if abs(action - self.action) > 0:
+        # Holding the current position needs no order, so only switching
+        # positions does any work
+        if action != self.action:
             src = self.cash if self.action == 0 else self.asset
             tgt = self.asset if self.action == 0 else self.cash
 
             if src.balance == 0:  # We need to check, regardless of the proposed order, if we have balance in 'src'
                 return []  # Otherwise just return an empty order list
 
-            order = proportion_order(portfolio, src, tgt, 1.0)
+            orders = [proportion_order(portfolio, src, tgt, 1.0)]
             self.action = action
 
         for listener in self.listeners:
             listener.on_action(action)
 
-        return [order]
+        return orders
 
     def reset(self):
         super().reset()
@@ -13,7 +13,6 @@ from random import randrange
 from tensortrade.feed.core import Stream, NameSpace, DataFeed
 from tensortrade.oms.wallets import Wallet
 from tensortrade.env.generic import Observer
-from collections import OrderedDict
 
 
 def _create_wallet_source(wallet: 'Wallet', include_worth: bool = True) -> 'List[Stream[float]]':
@@ -95,15 +94,16 @@ class ObservationHistory(object):
     ----------
     window_size : int
         The amount of observations to keep stored before discarding them.
-    rows : pd.DataFrame
+    rows : `np.array`
         The rows of observations that are used as the environment observation
-        at each step of an episode.
+        at each step of an episode. The window is allocated once on the first
+        push and is padded with zeros until `window_size` rows are stored.
 
     """
 
     def __init__(self, window_size: int) -> None:
         self.window_size = window_size
-        self.rows = OrderedDict()
+        self.rows = None
         self.index = 0
 
     def push(self, row: dict) -> None:
@@ -114,10 +114,15 @@ class ObservationHistory(object):
         row : dict
             The new observation to store.
         """
-        self.rows[self.index] = row
+        values = list(row.values())
+
+        if self.rows is None:
+            self.rows = np.zeros((self.window_size, len(values)))
+
+        # Shift the window up by one row and write the new row at the bottom
+        self.rows[:-1] = self.rows[1:]
+        self.rows[-1] = values
         self.index += 1
-        if len(self.rows.keys()) > self.window_size:
-            del self.rows[list(self.rows.keys())[0]]
 
     def observe(self) -> 'np.array':
         """Gets the observation at a given step in an episode
@@ -126,25 +131,19 @@ class ObservationHistory(object):
         -------
         `np.array`
             The current observation of the environment.
-        """
-        rows = self.rows.copy()
-
-        if len(rows) < self.window_size:
-            size = self.window_size - len(rows)
-            padding = np.zeros((size, len(rows[list(rows.keys())[0]])))
-            r = np.array([list(inner_dict.values()) for inner_dict in rows.values()])
-            rows = np.concatenate((padding, r))
 
-        if isinstance(rows, OrderedDict):
-            rows = np.array([list(inner_dict.values()) for inner_dict in rows.values()])
-
-        rows = np.nan_to_num(rows)
-
-        return rows
+        Raises
+        ------
+        IndexError
+            Raised if no observations have been pushed since the last reset.
+        """
+        if self.rows is None:
+            raise IndexError("No observations have been pushed to the history.")
+        return np.nan_to_num(self.rows)
 
     def reset(self) -> None:
         """Resets the observation history"""
-        self.rows = OrderedDict()
+        self.rows = None
         self.index = 0
 
 
@@ -454,11 +453,11 @@ class IntradayObserver(Observer):
         if self.randomize or not self.feed.has_next():
             self.feed.reset()
             if self.randomize:
-                episode_num = 0
-                while episode_num < randrange(self.num_episodes):
+                # Skip a fixed number of whole episodes, drawn once per reset
+                for _ in range(randrange(self.num_episodes)):
                     ts = self.feed.next()["external"]["timestamp"]
-                    if ts.time() == self.stop_time:
-                        episode_num += 1
+                    while ts.time() != self.stop_time:
+                        ts = self.feed.next()["external"]["timestamp"]
 
         self.warmup()
 
@@ -206,6 +206,16 @@ class ScreenLogger(BaseRenderer):
         super().__init__()
         self._date_format = date_format
 
+    def render(self, env: 'TradingEnv', **kwargs):
+        # Only the log entry is printed, so the price history and performance
+        # frames built by `BaseRenderer.render` would be discarded unused.
+        self.render_env(
+            episode=kwargs.get("episode", None),
+            max_episodes=kwargs.get("max_episodes", None),
+            step=env.clock.step,
+            max_steps=kwargs.get("max_steps", None)
+        )
+
     def render_env(self,
                    episode: int = None,
                    max_episodes: int = None,
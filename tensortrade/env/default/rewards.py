@@ -1,11 +1,10 @@
 
 from abc import abstractmethod
+from itertools import islice
 
 import numpy as np
-import pandas as pd
 
 from tensortrade.env.generic import RewardScheme, TradingEnv
-from tensortrade.feed.core import Stream, DataFeed
 import math
 
 
@@ -66,9 +65,11 @@ class SimpleProfit(TensorTradeRewardScheme):
             The cumulative percentage change in net worth over the previous
             `window_size` time steps.
         """
-        net_worths = [nw['net_worth'] for nw in portfolio.performance.values()]
-        if len(net_worths) > 1:
-            return net_worths[-1] / net_worths[-min(len(net_worths), self._window_size + 1)] - 1.0
+        performance = portfolio.performance
+        if len(performance) > 1:
+            # Only walk back over the window instead of the whole episode
+            window = list(islice(reversed(performance.values()), self._window_size + 1))
+            return window[0]['net_worth'] / window[-1]['net_worth'] - 1.0
         else:
             return 0.0
 
@@ -108,12 +109,12 @@ class RiskAdjustedReturns(TensorTradeRewardScheme):
         self._target_returns = self.default('target_returns', target_returns)
         self._window_size = self.default('window_size', window_size)
 
-    def _sharpe_ratio(self, returns: 'pd.Series') -> float:
+    def _sharpe_ratio(self, returns: 'np.array') -> float:
         """Computes the sharpe ratio for a given series of a returns.
 
         Parameters
         ----------
-        returns : `pd.Series`
+        returns : `np.array`
             The returns for the `portfolio`.
 
         Returns
@@ -127,12 +128,12 @@ class RiskAdjustedReturns(TensorTradeRewardScheme):
         """
         return (np.mean(returns) - self._risk_free_rate + 1e-9) / (np.std(returns) + 1e-9)
 
-    def _sortino_ratio(self, returns: 'pd.Series') -> float:
+    def _sortino_ratio(self, returns: 'np.array') -> float:
         """Computes the sortino ratio for a given series of a returns.
 
         Parameters
         ----------
-        returns : `pd.Series`
+        returns : `np.array`
             The returns for the `portfolio`.
 
         Returns
@@ -145,7 +146,8 @@ class RiskAdjustedReturns(TensorTradeRewardScheme):
         .. [1] https://en.wikipedia.org/wiki/Sortino_ratio
         """
         downside_returns = returns.copy()
-        downside_returns[returns < self._target_returns] = returns ** 2
+        mask = returns < self._target_returns
+        downside_returns[mask] = returns[mask] ** 2
 
         expected_return = np.mean(returns)
         downside_std = np.sqrt(np.std(downside_returns))
@@ -165,8 +167,12 @@ class RiskAdjustedReturns(TensorTradeRewardScheme):
         float
             The reward corresponding to the selected risk-adjusted return metric.
         """
-        net_worths = [nw['net_worth'] for nw in portfolio.performance.values()][-(self._window_size + 1):]
-        returns = pd.Series(net_worths).pct_change().dropna()
+        window = islice(reversed(portfolio.performance.values()), self._window_size + 1)
+        net_worths = np.array([nw['net_worth'] for nw in window][::-1], dtype=float)
+
+        returns = net_worths[1:] / net_worths[:-1] - 1.0
+        returns = returns[~np.isnan(returns)]
+
         risk_adjusted_return = self._return_algorithm(returns)
         return risk_adjusted_return
 
@@ -192,25 +198,29 @@ class PBR(TensorTradeRewardScheme):
     def __init__(self, price: 'Stream') -> None:
         super().__init__()
         self.position = -1
+        self.price = price
 
-        r = Stream.sensor(price, lambda p: p.value, dtype="float").diff()
-        position = Stream.sensor(self, lambda rs: rs.position, dtype="float")
-
-        reward = (position * r).fillna(0).rename("reward")
-
-        self.feed = DataFeed([reward])
-        self.feed.compile()
+        self._last_price = None
 
     def on_action(self, action: int) -> None:
         self.position = -1 if action == 0 else 1
 
     def get_reward(self, portfolio: 'Portfolio') -> float:
-        return self.feed.next()["reward"]
+        price = self.price.value
+
+        reward = 0.0
+        if self._last_price is not None:
+            reward = (price - self._last_price) * self.position
+            if np.isnan(reward):
+                reward = 0.0
+
+        self._last_price = price
+        return reward
 
     def reset(self) -> None:
-        """Resets the `position` and `feed` of the reward scheme."""
+        """Resets the `position` and last seen price of the reward scheme."""
         self.position = -1
-        self.feed.reset()
+        self._last_price = None
 
 
 _registry = {
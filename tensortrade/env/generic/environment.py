@@ -16,7 +16,6 @@ import uuid
 import logging
 
 from typing import Dict, Any, Tuple
-from random import randint
 
 import gymnasium
 import numpy as np
@@ -139,14 +138,25 @@ class TradingEnv(gymnasium.Env, TimeIndexed):
     def reset(self,seed = None, options = None) -> tuple["np.array", dict[str, Any]]:
         """Resets the environment.
 
+        Parameters
+        ----------
+        seed : int, optional
+            The seed for the environment's random number generator. The
+            random start offset is drawn from `np_random`, so it is made
+            reproducible by passing `seed` here and not by `random.seed`.
+        options : dict, optional
+            Additional information to specify how the environment is reset.
+
         Returns
         -------
         obs : `np.array`
             The first observation of the environment.
         """
+        super().reset(seed=seed)
+
         if self.random_start_pct > 0.00:
             size = len(self.observer.feed.process[-1].inputs[0].iterable)
-            random_start = randint(0, int(size * self.random_start_pct))
+            random_start = int(self.np_random.integers(int(size * self.random_start_pct), endpoint=True))
         else:
             random_start = 0
 
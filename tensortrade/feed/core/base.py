@@ -5,6 +5,7 @@ from abc import abstractmethod
 from typing import (
     Generic,
     Iterable,
+    Iterator,
     TypeVar,
     Dict,
     Any,
@@ -13,6 +14,9 @@ from typing import (
     Tuple
 )
 
+import numpy as np
+import pandas as pd
+
 from tensortrade.core import Observable
 from tensortrade.feed.core.accessors import CachedAccessor
 from tensortrade.feed.core.mixins import DataTypeMixin
@@ -235,6 +239,9 @@ class Stream(Generic[T], Named, Observable):
     def source(iterable: "Iterable[T]", dtype: str = None) -> "Stream[T]":
         """Creates a stream from an iterable.
 
+        NumPy arrays and pandas series can be given directly, there is no need
+        to convert them to a list first.
+
         Parameters
         ----------
         iterable : `Iterable[T]`
@@ -247,6 +254,8 @@ class Stream(Generic[T], Named, Observable):
         `Stream[T]`
             The stream with the data type `dtype` created from `iterable`.
         """
+        if isinstance(iterable, np.ndarray) and iterable.ndim == 1 and iterable.dtype.kind in "biuf":
+            return ArrayStream(iterable, dtype=dtype)
         return IterableStream(iterable, dtype=dtype)
 
     @staticmethod
@@ -519,7 +528,7 @@ class IterableStream(Stream[T]):
             self.generator = self.gen_fn()
         else:
             self.iterable = source
-            self.generator = iter(source)
+            self.generator = self._iterate(source)
 
         self.stop = False
         
@@ -530,6 +539,19 @@ class IterableStream(Stream[T]):
 
         self._random_start = 0
 
+    @staticmethod
+    def _iterate(iterable: "Iterable[T]") -> "Iterator[T]":
+        # Pandas series and one-dimensional numeric or object NumPy arrays
+        # yield native Python values. This converts the remaining data to a
+        # list, so it is a convenience for the caller rather than a memory
+        # saving. Other arrays, such as datetime64 arrays whose tolist gives
+        # plain integers, and rows of N-d arrays are iterated as they are.
+        if isinstance(iterable, pd.Series):
+            return iter(iterable.tolist())
+        if isinstance(iterable, np.ndarray) and iterable.ndim == 1 and iterable.dtype.kind in "biufcO":
+            return iter(iterable.tolist())
+        return iter(iterable)
+
     def forward(self) -> T:
         v = self.current
         try:
@@ -548,7 +570,7 @@ class IterableStream(Stream[T]):
         if self.is_gen:
             self.generator = self.gen_fn()
         else:
-            self.generator = iter(self.iterable[self._random_start:])
+            self.generator = self._iterate(self.iterable[self._random_start:])
         self.stop = False
 
         try:
@@ -558,6 +580,53 @@ class IterableStream(Stream[T]):
         super().reset()
 
 
+class ArrayStream(Stream[T]):
+    """A private class used the `Stream` class for creating data sources from
+    one-dimensional numeric NumPy arrays.
+
+    Values are read from the array by position, so resetting the stream only
+    moves the position instead of rebuilding an iterator over the data. Like
+    `IterableStream`, the last value keeps being returned once the array has
+    been exhausted.
+
+    Parameters
+    ----------
+    source : `np.ndarray`
+        The array to be used for providing the data.
+    dtype : str, optional
+        The data type of the source.
+    """
+
+    generic_name = "stream"
+
+    def __init__(self, source: "np.ndarray", dtype: str = None):
+        super().__init__(dtype=dtype)
+        self.iterable = source
+        self.stop = len(source) == 0
+
+        self._index = 0
+        self._random_start = 0
+
+    def forward(self) -> T:
+        v = self.iterable[self._index].item()
+        if self._index + 1 < len(self.iterable):
+            self._index += 1
+        else:
+            self.stop = True
+        return v
+
+    def has_next(self) -> bool:
+        return not self.stop
+
+    def reset(self, random_start=0):
+        if random_start != 0:
+            self._random_start = random_start
+
+        self._index = min(self._random_start, max(len(self.iterable) - 1, 0))
+        self.stop = self._random_start >= len(self.iterable)
+        super().reset()
+
+
 class Group(Stream[T]):
     """A stream that groups together other streams into a dictionary."""
 
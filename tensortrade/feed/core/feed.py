@@ -2,7 +2,7 @@
 
 from typing import List
 
-from tensortrade.feed.core.base import Stream, T, Placeholder, IterableStream
+from tensortrade.feed.core.base import Stream, T, Placeholder, IterableStream, ArrayStream
 
 
 class DataFeed(Stream[dict]):
@@ -56,7 +56,7 @@ class DataFeed(Stream[dict]):
 
     def reset(self, random_start=0) -> None:
         for s in self.process:
-            if isinstance(s, IterableStream):
+            if isinstance(s, (IterableStream, ArrayStream)):
                 s.reset(random_start)
             else:
                 s.reset()
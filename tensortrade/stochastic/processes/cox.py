@@ -43,13 +43,16 @@ def cox_ingersoll_ross_levels(params: 'ModelParameters') -> 'np.array':
     # Setup the parameters for interest rates
     a, mu, zero = params.cir_a, params.cir_mu, params.all_r0
     # Assumes output is in levels
-    levels = [zero]
-    for i in range(1, params.all_time):
-        drift = a * (mu - levels[i - 1]) * params.all_delta
+    delta, sqrt = params.all_delta, np.sqrt
+    level = zero
+    levels = [level]
+    for dw in brownian_motion[:params.all_time - 1]:
+        drift = a * (mu - level) * delta
         # The main difference between this and the Ornstein Uhlenbeck model is that we multiply the 'random'
         # component by the square-root of the previous level i.e. the process has level dependent interest rates.
-        randomness = np.sqrt(levels[i - 1]) * brownian_motion[i - 1]
-        levels.append(levels[i - 1] + drift + randomness)
+        randomness = sqrt(level) * dw
+        level = level + drift + randomness
+        levels.append(level)
     return np.array(levels)
 
 
@@ -17,7 +17,7 @@ import pandas as pd
 from stochastic.processes.noise import GaussianNoise
 from stochastic.processes.continuous import FractionalBrownianMotion
 
-from tensortrade.stochastic.utils import scale_times_to_generate
+from tensortrade.stochastic.utils import scale_times_to_generate, resample_ohlcv
 
 
 def fbm(base_price: int = 1,
@@ -67,22 +67,6 @@ def fbm(base_price: int = 1,
     volumes = volume_volatility * price_volatility + base_volume
 
     start_date = pd.to_datetime(start_date, format=start_date_format)
-    price_frame = pd.DataFrame([], columns=['date', 'price'], dtype=float)
-    volume_frame = pd.DataFrame([], columns=['date', 'volume'], dtype=float)
-
-    price_frame['date'] = pd.date_range(start=start_date, periods=times_to_generate, freq="1min")
-    price_frame['price'] = abs(prices)
-
-    volume_frame['date'] = price_frame['date'].copy()
-    volume_frame['volume'] = abs(volumes)
-
-    price_frame.set_index('date')
-    price_frame.index = pd.to_datetime(price_frame.index, unit='m', origin=start_date)
-
-    volume_frame.set_index('date')
-    volume_frame.index = pd.to_datetime(volume_frame.index, unit='m', origin=start_date)
-
-    data_frame = price_frame['price'].resample(time_frame).ohlc()
-    data_frame['volume'] = volume_frame['volume'].resample(time_frame).sum()
+    data_frame = resample_ohlcv(prices, volumes, start_date, time_frame)
 
     return data_frame
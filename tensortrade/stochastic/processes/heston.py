@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License
 
+import math
 import random
 import numpy as np
 import pandas as pd
@@ -44,15 +45,13 @@ def jump_diffusion_process(params: 'ModelParameters') -> 'np.array':
     """
     s_n = time = 0
     small_lamda = -(1.0 / params.lamda)
-    jump_sizes = []
-    for _ in range(params.all_time):
-        jump_sizes.append(0.0)
+    jump_sizes = np.zeros(params.all_time)
     while s_n < params.all_time:
         s_n += small_lamda * np.log(np.random.uniform(0, 1))
-        for j in range(params.all_time):
-            if time * params.all_delta <= s_n * params.all_delta <= (j + 1) * params.all_delta:
-                jump_sizes[j] += random.normalvariate(params.jumps_mu, params.jumps_sigma)
-                break
+        # The jump lands in the first period j for which s_n <= j + 1
+        j = max(math.ceil(s_n) - 1, 0)
+        if time <= s_n and j < params.all_time:
+            jump_sizes[j] += random.normalvariate(params.jumps_mu, params.jumps_sigma)
         time += 1
     return jump_sizes
 
@@ -121,11 +120,14 @@ def cox_ingersoll_ross_heston(params: 'ModelParameters') -> 'np.array':
     sqrt_delta_sigma = np.sqrt(params.all_delta) * params.all_sigma
     brownian_motion_volatility = np.random.normal(loc=0, scale=sqrt_delta_sigma, size=params.all_time)
     a, mu, zero = params.heston_a, params.heston_mu, params.heston_vol0
-    volatilities = [zero]
-    for i in range(1, params.all_time):
-        drift = a * (mu - volatilities[i - 1]) * params.all_delta
-        randomness = np.sqrt(volatilities[i - 1]) * brownian_motion_volatility[i - 1]
-        volatilities.append(volatilities[i - 1] + drift + randomness)
+    delta, sqrt = params.all_delta, np.sqrt
+    volatility = zero
+    volatilities = [volatility]
+    for dw in brownian_motion_volatility[:params.all_time - 1]:
+        drift = a * (mu - volatility) * delta
+        randomness = sqrt(volatility) * dw
+        volatility = volatility + drift + randomness
+        volatilities.append(volatility)
     return np.array(brownian_motion_volatility), np.array(volatilities)
 
 
@@ -149,13 +151,13 @@ def heston_construct_correlated_path(params: 'ModelParameters',
     """
     # We do not multiply by sigma here, we do that in the Heston model
     sqrt_delta = np.sqrt(params.all_delta)
-    # Construct a path correlated to the first path
-    brownian_motion_two = []
-    for i in range(params.all_time - 1):
-        term_one = params.cir_rho * brownian_motion_one[i]
-        term_two = np.sqrt(1 - pow(params.cir_rho, 2)) * random.normalvariate(0, sqrt_delta)
-        brownian_motion_two.append(term_one + term_two)
-    return np.array(brownian_motion_one), np.array(brownian_motion_two)
+    brownian_motion_one = np.array(brownian_motion_one)
+    # Construct a path correlated to the first path from a single draw of noise
+    noise = np.random.normal(loc=0, scale=sqrt_delta, size=params.all_time - 1)
+    term_one = params.cir_rho * brownian_motion_one[:params.all_time - 1]
+    term_two = np.sqrt(1 - pow(params.cir_rho, 2)) * noise
+    brownian_motion_two = term_one + term_two
+    return brownian_motion_one, brownian_motion_two
 
 
 def heston_model_levels(params: 'ModelParameters') -> 'np.array':
@@ -186,11 +188,14 @@ def heston_model_levels(params: 'ModelParameters') -> 'np.array':
     brownian, cir_process = cox_ingersoll_ross_heston(params)
     brownian, brownian_motion_market = heston_construct_correlated_path(params, brownian)
 
-    heston_market_price_levels = [params.all_s0]
-    for i in range(1, params.all_time):
-        drift = params.gbm_mu * heston_market_price_levels[i - 1] * params.all_delta
-        vol = cir_process[i - 1] * heston_market_price_levels[i - 1] * brownian_motion_market[i - 1]
-        heston_market_price_levels.append(heston_market_price_levels[i - 1] + drift + vol)
+    mu, delta = params.gbm_mu, params.all_delta
+    level = params.all_s0
+    heston_market_price_levels = [level]
+    for volatility, dw in zip(cir_process[:params.all_time - 1], brownian_motion_market):
+        drift = mu * level * delta
+        vol = volatility * level * dw
+        level = level + drift + vol
+        heston_market_price_levels.append(level)
     return np.array(heston_market_price_levels), np.array(cir_process)
 
 
@@ -215,25 +220,12 @@ def get_correlated_geometric_brownian_motions(params: 'ModelParameters',
         n correlated log return geometric brownian motion processes.
     """
     decomposition = sp.linalg.cholesky(correlation_matrix, lower=False)
-    uncorrelated_paths = []
     sqrt_delta_sigma = np.sqrt(params.all_delta) * params.all_sigma
-    # Construct uncorrelated paths to convert into correlated paths
-    for i in range(params.all_time):
-        uncorrelated_random_numbers = []
-        for j in range(n):
-            uncorrelated_random_numbers.append(random.normalvariate(0, sqrt_delta_sigma))
-        uncorrelated_paths.append(np.array(uncorrelated_random_numbers))
-    uncorrelated_matrix = np.asmatrix(uncorrelated_paths)
-    correlated_matrix = uncorrelated_matrix * decomposition
-    assert isinstance(correlated_matrix, np.matrix)
-    # The rest of this method just extracts paths from the matrix
-    extracted_paths = []
-    for i in range(1, n + 1):
-        extracted_paths.append([])
-    for j in range(0, len(correlated_matrix) * n - n, n):
-        for i in range(n):
-            extracted_paths[i].append(correlated_matrix.item(j + i))
-    return extracted_paths
+    # Draw every uncorrelated increment in one call, one column per asset
+    uncorrelated_matrix = np.random.normal(loc=0, scale=sqrt_delta_sigma, size=(params.all_time, n))
+    correlated_matrix = uncorrelated_matrix @ decomposition
+    # The final time step is dropped to keep the original path length
+    return correlated_matrix[:-1].T.tolist()
 
 
 def heston(base_price: int = 1,
@@ -18,7 +18,7 @@ import pandas as pd
 from stochastic.processes.noise import GaussianNoise
 
 from tensortrade.stochastic.processes.brownian_motion import brownian_motion_log_returns
-from tensortrade.stochastic.utils.helpers import get_delta, scale_times_to_generate
+from tensortrade.stochastic.utils.helpers import get_delta, scale_times_to_generate, resample_ohlcv
 from tensortrade.stochastic.utils.parameters import ModelParameters, default
 
 
@@ -36,12 +36,14 @@ def ornstein_uhlenbeck_levels(params: 'ModelParameters') -> 'np.array':
     `np.array`
         The interest rate levels for the Ornstein Uhlenbeck process
     """
-    ou_levels = [params.all_r0]
+    a, mu, delta = params.ou_a, params.ou_mu, params.all_delta
+    level = params.all_r0
+    ou_levels = [level]
     brownian_motion_returns = brownian_motion_log_returns(params)
-    for i in range(1, params.all_time):
-        drift = params.ou_a * (params.ou_mu - ou_levels[i - 1]) * params.all_delta
-        randomness = brownian_motion_returns[i - 1]
-        ou_levels.append(ou_levels[i - 1] + drift + randomness)
+    for randomness in brownian_motion_returns[:params.all_time - 1]:
+        drift = a * (mu - level) * delta
+        level = level + drift + randomness
+        ou_levels.append(level)
     return np.array(ou_levels)
 
 
@@ -92,22 +94,6 @@ def ornstein(base_price: int = 1,
     volumes = volume_gen.sample(times_to_generate) + base_volume
 
     start_date = pd.to_datetime(start_date, format=start_date_format)
-    price_frame = pd.DataFrame([], columns=['date', 'price'], dtype=float)
-    volume_frame = pd.DataFrame([], columns=['date', 'volume'], dtype=float)
-
-    price_frame['date'] = pd.date_range(start=start_date, periods=times_to_generate, freq="1min")
-    price_frame['price'] = abs(prices)
-
-    volume_frame['date'] = price_frame['date'].copy()
-    volume_frame['volume'] = abs(volumes)
-
-    price_frame.set_index('date')
-    price_frame.index = pd.to_datetime(price_frame.index, unit='m', origin=start_date)
-
-    volume_frame.set_index('date')
-    volume_frame.index = pd.to_datetime(volume_frame.index, unit='m', origin=start_date)
-
-    data_frame = price_frame['price'].resample(time_frame).ohlc()
-    data_frame['volume'] = volume_frame['volume'].resample(time_frame).sum()
+    data_frame = resample_ohlcv(prices, volumes, start_date, time_frame)
 
     return data_frame
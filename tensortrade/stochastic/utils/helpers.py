@@ -102,14 +102,43 @@ def convert_to_prices(param: 'ModelParameters', log_returns: 'np.array') -> 'np.
     `np.array`
         The price sequence.
     """
-    returns = np.exp(log_returns)
-    # A sequence of prices starting with param.all_s0
-    price_sequence = [param.all_s0]
-    for i in range(1, len(returns)):
-        # Add the price at t-1 * return at t
-        price_sequence += [price_sequence[i - 1] * returns[i - 1]]
+    # A sequence of prices starting with param.all_s0 followed by the returns,
+    # so a running product gives the price at t-1 * return at t in place
+    price_sequence = np.empty(max(len(log_returns), 1))
+    price_sequence[0] = param.all_s0
+    np.exp(log_returns[:-1], out=price_sequence[1:])
 
-    return np.array(price_sequence)
+    return np.cumprod(price_sequence, out=price_sequence)
+
+
+def resample_ohlcv(prices: 'np.array',
+                   volumes: 'np.array',
+                   start_date: 'pd.Timestamp',
+                   time_frame: str) -> 'pd.DataFrame':
+    """Resamples minute level prices and volumes into OHLCV bars.
+
+    Parameters
+    ----------
+    prices : `np.array`
+        The price at each minute, starting at `start_date`.
+    volumes : `np.array`
+        The volume at each minute, starting at `start_date`.
+    start_date : `pd.Timestamp`
+        The time of the first price and volume.
+    time_frame : str
+        The time frame of the bars.
+
+    Returns
+    -------
+    `pd.DataFrame`
+        The data frame containing the OHLCV bars.
+    """
+    index = pd.to_datetime(np.arange(len(prices)), unit='m', origin=start_date)
+
+    data_frame = pd.Series(np.abs(prices), index=index).resample(time_frame).ohlc()
+    data_frame['volume'] = pd.Series(np.abs(volumes), index=index).resample(time_frame).sum()
+
+    return data_frame
 
 
 def generate(price_fn: 'Callable[[ModelParameters], np.array]',
@@ -158,22 +187,6 @@ def generate(price_fn: 'Callable[[ModelParameters], np.array]',
     volumes = volume_gen.sample(times_to_generate) + base_volume
 
     start_date = pd.to_datetime(start_date, format=start_date_format)
-    price_frame = pd.DataFrame([], columns=['date', 'price'], dtype=float)
-    volume_frame = pd.DataFrame([], columns=['date', 'volume'], dtype=float)
-
-    price_frame['date'] = pd.date_range(start=start_date, periods=times_to_generate, freq="1min")
-    price_frame['price'] = abs(prices)
-
-    volume_frame['date'] = price_frame['date'].copy()
-    volume_frame['volume'] = abs(volumes)
-
-    price_frame.set_index('date')
-    price_frame.index = pd.to_datetime(price_frame.index, unit='m', origin=start_date)
-
-    volume_frame.set_index('date')
-    volume_frame.index = pd.to_datetime(volume_frame.index, unit='m', origin=start_date)
-
-    data_frame = price_frame['price'].resample(time_frame).ohlc()
-    data_frame['volume'] = volume_frame['volume'].resample(time_frame).sum()
+    data_frame = resample_ohlcv(prices, volumes, start_date, time_frame)
 
     return data_frame
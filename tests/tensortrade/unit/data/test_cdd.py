@@ -0,0 +1,53 @@
+
+import io
+import unittest.mock as mock
+
+import pandas as pd
+
+from tensortrade.data.cdd import CryptoDataDownload
+
+
+CSV = """https://www.CryptoDataDownload.com
+unix,Date,symbol,Open,High,Low,Close,Volume BTC,Volume USD
+1500086400,2017-07-15,BTC/USD,2,3,1.5,2.5,20,50
+1500000000000,2017-07-14,BTC/USD,1,2,0.5,1.5,10,15
+"""
+
+
+def read_csv(url, _read_csv=pd.read_csv, **kwargs):
+    return _read_csv(io.StringIO(CSV), **kwargs)
+
+
+@mock.patch("tensortrade.data.cdd.pd.read_csv", side_effect=read_csv)
+def test_fetch_without_cache(download):
+    cdd = CryptoDataDownload()
+
+    cdd.fetch("Bitfinex", "USD", "BTC", "d")
+    cdd.fetch("Bitfinex", "USD", "BTC", "d")
+
+    assert download.call_count == 2
+
+
+@mock.patch("tensortrade.data.cdd.pd.read_csv", side_effect=read_csv)
+def test_fetch_with_cache(download):
+    cdd = CryptoDataDownload(cache=True)
+
+    df = cdd.fetch("Bitfinex", "USD", "BTC", "d")
+    assert list(df.close) == [1.5, 2.5]
+    assert list(df.volume) == [15, 50]
+
+    df["close"] = 0
+    df.loc[0, "open"] = -1
+
+    df = cdd.fetch("Bitfinex", "USD", "BTC", "d")
+    assert download.call_count == 1
+    assert download.call_args[0][0] == cdd.url + "Bitfinex_BTCUSD_d.csv"
+    assert list(df.close) == [1.5, 2.5]
+    assert list(df.open) == [1, 2]
+
+    cdd.fetch("Bitfinex", "USD", "BTC", "d", include_all_volumes=True)
+    assert download.call_count == 1
+
+    cdd.clear_cache()
+    cdd.fetch("Bitfinex", "USD", "BTC", "d")
+    assert download.call_count == 2
@@ -0,0 +1,49 @@
+
+import tensortrade.env.default.actions as actions
+
+from tensortrade.feed.core import Stream, DataFeed
+from tensortrade.oms.exchanges import Exchange
+from tensortrade.oms.instruments import USD, BTC
+from tensortrade.oms.orders import Order
+from tensortrade.oms.services.execution.simulated import execute_order
+from tensortrade.oms.wallets import Portfolio, Wallet
+
+
+class TestBSH:
+
+    def setup_method(self):
+        exchange = Exchange("bitfinex", service=execute_order)(
+            Stream.source([7000.0], dtype="float").rename("USD-BTC")
+        )
+        self.cash = Wallet(exchange, 10000 * USD)
+        self.asset = Wallet(exchange, 0 * BTC)
+        self.portfolio = Portfolio(USD, [self.cash, self.asset])
+
+        DataFeed([exchange.streams()[0]]).next()
+
+        self.scheme = actions.BSH(self.cash, self.asset)
+        self.scheme.portfolio = self.portfolio
+
+        self.actions = []
+
+        class Listener:
+            def on_action(listener, action):
+                self.actions += [action]
+
+        self.scheme.attach(Listener())
+
+    def test_hold_creates_no_orders(self):
+        assert self.scheme.get_orders(0, self.portfolio) == []
+        assert self.scheme.action == 0
+        assert self.actions == [0]
+
+    def test_switch_creates_order(self):
+        orders = self.scheme.get_orders(1, self.portfolio)
+
+        assert len(orders) == 1
+        assert isinstance(orders[0], Order)
+        assert self.scheme.action == 1
+        assert self.actions == [1]
+
+        assert self.scheme.get_orders(1, self.portfolio) == []
+        assert self.actions == [1, 1]
@@ -1,5 +1,6 @@
 
 
+import numpy as np
 import pandas as pd
 import pytest
 import ta
@@ -148,3 +149,37 @@ def test_runs_with_random_start(portfolio):
         obs, reward, done, info = env.step(action)
 
     assert obs.shape[0] == 50
+
+
+def test_reset_with_seed_is_reproducible(portfolio):
+
+    df = pd.read_csv("tests/data/input/bitfinex_(BTC,ETH)USD_d.csv").tail(100)
+
+    feed = DataFeed([
+        Stream.source(list(df["BTC:close"]), dtype="float").rename("BTC:close")
+    ])
+
+    env = default.create(
+        portfolio=portfolio,
+        action_scheme=ManagedRiskOrders(),
+        reward_scheme=SimpleProfit(),
+        feed=feed,
+        window_size=5,
+        enable_logger=False,
+        random_start_pct=0.50,
+    )
+
+    observations = []
+    for seed in range(10):
+        obs, _ = env.reset(seed=seed)
+        step = env.clock.step
+
+        env.step(env.action_space.sample())
+
+        same_obs, _ = env.reset(seed=seed)
+
+        assert env.clock.step == step
+        np.testing.assert_array_equal(obs, same_obs)
+        observations += [obs[-1, 0]]
+
+    assert len(set(observations)) > 1
@@ -1,5 +1,17 @@
 
-from tensortrade.env.default.observers import _create_internal_streams, _create_wallet_source
+import datetime as dt
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tensortrade.env.default.observers import (
+    _create_internal_streams,
+    _create_wallet_source,
+    ObservationHistory,
+    IntradayObserver
+)
 from tensortrade.feed.core import DataFeed, Stream
 from tensortrade.oms.exchanges import Exchange
 from tensortrade.oms.services.execution.simulated import execute_order
@@ -143,3 +155,84 @@ def test_exchange_with_wallets_feed():
         "binance:/USD:/locked": 400,
         "binance:/USD:/total": 1000
     }
+
+
+class TestObservationHistory:
+
+    def test_pads_until_window_is_full(self):
+        history = ObservationHistory(window_size=3)
+
+        history.push({"a": 1.0, "b": 2.0})
+        history.push({"a": 3.0, "b": np.nan})
+
+        np.testing.assert_array_equal(history.observe(), [
+            [0.0, 0.0],
+            [1.0, 2.0],
+            [3.0, 0.0]
+        ])
+
+    def test_evicts_oldest_row(self):
+        history = ObservationHistory(window_size=2)
+
+        for i in range(4):
+            history.push({"a": float(i), "b": float(10 * i)})
+
+        np.testing.assert_array_equal(history.observe(), [
+            [2.0, 20.0],
+            [3.0, 30.0]
+        ])
+        assert history.index == 4
+
+    def test_reset(self):
+        history = ObservationHistory(window_size=2)
+
+        history.push({"a": 1.0})
+        history.push({"a": 2.0})
+        history.reset()
+
+        assert history.index == 0
+        with pytest.raises(IndexError):
+            history.observe()
+
+        history.push({"a": 5.0})
+        np.testing.assert_array_equal(history.observe(), [[0.0], [5.0]])
+
+
+def test_intraday_observer_random_reset():
+
+    # Five episodes that end at 16:00, followed by two trailing ticks
+    timestamps = list(pd.date_range("2020-01-01 14:00", periods=4 * 24 + 5, freq="h"))
+    stop_time = dt.time(16, 0, 0)
+
+    exchange = Exchange("bitfinex", service=execute_order)(
+        Stream.source([7000.0] * len(timestamps), dtype="float").rename("USD-BTC")
+    )
+    portfolio = Portfolio(USD, [
+        Wallet(exchange, 10000 * USD),
+        Wallet(exchange, 0 * BTC)
+    ])
+    feed = DataFeed([
+        Stream.source(timestamps).rename("timestamp"),
+        Stream.source(list(range(len(timestamps))), dtype="float").rename("x")
+    ])
+
+    observer = IntradayObserver(portfolio, feed, stop_time=stop_time, randomize=True)
+
+    assert observer.num_episodes == 5
+
+    episode_starts = [timestamps[0]] + [
+        ts + pd.Timedelta(hours=1) for ts in timestamps if ts.time() == stop_time
+    ]
+
+    random.seed(0)
+    starts = set()
+    for _ in range(100):
+        observer.reset()
+
+        assert observer.has_next()
+
+        ts = observer.feed.next()["external"]["timestamp"]
+        assert ts in episode_starts
+        starts.add(ts)
+
+    assert len(starts) == observer.num_episodes
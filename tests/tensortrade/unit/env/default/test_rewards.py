@@ -9,6 +9,7 @@ import tensortrade.env.default.rewards as rewards
 from tensortrade.core import TradingContext
 from tensortrade.oms.wallets import Portfolio
 from tensortrade.oms.instruments import USD
+from tensortrade.feed.core import Stream
 
 
 class TestTensorTradeRewardScheme:
@@ -87,8 +88,51 @@ class TestSimpleProfit:
         assert reward_scheme.get_reward(portfolio) == reward
 
 
+    def test_get_reward_window(self):
+        portfolio = Portfolio(USD)
+        portfolio._performance = net_worths_to_dict([80, 100, 125, 100, 160])
+
+        reward_scheme = rewards.SimpleProfit(window_size=1)
+        assert reward_scheme.get_reward(portfolio) == pytest.approx(160 / 100 - 1)
+
+        reward_scheme = rewards.SimpleProfit(window_size=2)
+        assert reward_scheme.get_reward(portfolio) == pytest.approx(160 / 125 - 1)
+
+        # A window larger than the history starts from the first net worth
+        reward_scheme = rewards.SimpleProfit(window_size=10)
+        assert reward_scheme.get_reward(portfolio) == pytest.approx(160 / 80 - 1)
+
+        portfolio._performance = net_worths_to_dict([80])
+        assert reward_scheme.get_reward(portfolio) == 0.0
+
+
 class TestRiskAdjustedReturns:
 
+    def test_get_reward_sharpe(self):
+        portfolio = Portfolio(USD)
+        portfolio._performance = net_worths_to_dict([80, 100, 125, 100, 160])
+
+        # Returns over the last two steps are -0.2 and 0.6
+        scheme = rewards.RiskAdjustedReturns(return_algorithm='sharpe', window_size=2)
+        assert scheme.get_reward(portfolio) == pytest.approx(0.2 / 0.4)
+
+        # Returns over the whole history are 0.25, 0.25, -0.2 and 0.6
+        scheme = rewards.RiskAdjustedReturns(return_algorithm='sharpe', window_size=10)
+        assert scheme.get_reward(portfolio) == pytest.approx(0.225 / np.sqrt(0.080625))
+
+    def test_get_reward_sortino(self):
+        portfolio = Portfolio(USD)
+        portfolio._performance = net_worths_to_dict([80, 100, 125, 100, 160])
+
+        # Downside returns over the last two steps are 0.04 and 0.6
+        scheme = rewards.RiskAdjustedReturns(return_algorithm='sortino', window_size=2)
+        assert scheme.get_reward(portfolio) == pytest.approx(0.2 / np.sqrt(np.std([0.04, 0.6])))
+
+        # Downside returns over the whole history are 0.25, 0.25, 0.04 and 0.6
+        scheme = rewards.RiskAdjustedReturns(return_algorithm='sortino', window_size=10)
+        downside_std = np.sqrt(np.std([0.25, 0.25, 0.04, 0.6]))
+        assert scheme.get_reward(portfolio) == pytest.approx(0.225 / downside_std)
+
     def test_sharpe_ratio(self, net_worths):
         scheme = rewards.RiskAdjustedReturns(
             return_algorithm='sharpe',
@@ -123,3 +167,29 @@ class TestRiskAdjustedReturns:
         sortino_ratio = scheme._sortino_ratio(returns)
 
         assert sortino_ratio == expected_ratio
+
+
+class TestPBR:
+
+    def test_get_reward(self):
+        price = Stream.placeholder(dtype="float")
+        portfolio = Portfolio(USD)
+
+        scheme = rewards.PBR(price)
+
+        price.push(100.0)
+        assert scheme.get_reward(portfolio) == 0
+
+        price.push(110.0)
+        assert scheme.get_reward(portfolio) == -10.0
+
+        scheme.on_action(1)
+        price.push(105.0)
+        assert scheme.get_reward(portfolio) == -5.0
+
+        price.push(np.nan)
+        assert scheme.get_reward(portfolio) == 0
+
+        scheme.reset()
+        price.push(120.0)
+        assert scheme.get_reward(portfolio) == 0
@@ -1,4 +1,6 @@
 
+import numpy as np
+import pandas as pd
 
 from tensortrade.feed.core import Stream, NameSpace
 
@@ -85,6 +87,86 @@ def test_stream_source():
     assert s.forward() == 1
 
 
+def test_stream_source_array():
+
+    s = Stream.source(np.array([1.5, 2.5, 3.5], dtype=np.float32), dtype="float")
+
+    v = s.forward()
+    assert v == 1.5
+    assert type(v) is float
+    assert s.forward() == 2.5
+
+    s.reset(random_start=1)
+
+    assert s.forward() == 2.5
+    assert s.forward() == 3.5
+    assert not s.has_next()
+
+
+def test_stream_source_array_past_end():
+
+    s = Stream.source(np.array([1.0, 2.0]), dtype="float")
+
+    assert s.forward() == 1.0
+    assert s.has_next()
+    assert s.forward() == 2.0
+    assert not s.has_next()
+    assert s.forward() == 2.0
+
+    s.reset()
+
+    assert s.has_next()
+    assert s.forward() == 1.0
+
+
+def test_stream_source_object_array():
+
+    s = Stream.source(np.array(["a", "b"], dtype=object), dtype="string")
+
+    assert s.forward() == "a"
+    assert s.forward() == "b"
+    assert not s.has_next()
+
+    timestamps = pd.date_range("2020-01-01", periods=2, freq="D", tz="UTC")
+    s = Stream.source(np.array(list(timestamps), dtype=object))
+
+    assert s.forward() == timestamps[0]
+    assert s.forward() == timestamps[1]
+
+    s = Stream.source(np.array(["a", "b"]), dtype="string")
+
+    assert s.forward() == "a"
+
+
+def test_stream_source_datetime_array():
+
+    s = Stream.source(np.array(["2020-01-01T01:00", "2020-01-02T01:00"], dtype="datetime64[ns]"))
+
+    v = s.forward()
+    assert isinstance(v, np.datetime64)
+    assert v == np.datetime64("2020-01-01T01:00")
+
+    s = Stream.source(np.array([1, 2], dtype="timedelta64[s]"))
+
+    v = s.forward()
+    assert isinstance(v, np.timedelta64)
+    assert v == np.timedelta64(1, "s")
+
+    s = Stream.source(pd.Series(pd.date_range("2020-01-01", periods=2, freq="D")))
+
+    assert s.forward() == pd.Timestamp("2020-01-01")
+
+
+def test_stream_source_2d_array():
+
+    s = Stream.source(np.arange(6.).reshape(3, 2))
+
+    v = s.forward()
+    assert isinstance(v, np.ndarray)
+    np.testing.assert_array_equal(v, [0., 1.])
+    np.testing.assert_array_equal(s.forward() + 1, [3., 4.])
+
+
 def test_placholder():
 
     s = Stream.placeholder(dtype="float")
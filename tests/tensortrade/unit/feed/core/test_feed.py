@@ -1,6 +1,8 @@
 
 
-from tensortrade.feed import Stream
+import numpy as np
+
+from tensortrade.feed import Stream, DataFeed
 from tensortrade.feed.core.feed import PushFeed
 
 
@@ -61,3 +63,20 @@ def test_push_one_datum():
             "v3": expected["v3"][i],
             "v4": expected["v4"][i]
         }
+
+
+def test_reset_array_source_with_random_start():
+
+    s1 = Stream.source(np.array([1.0, 2.0, 3.0, 4.0]), dtype="float").rename("s1")
+    s2 = Stream.source([5.0, 6.0, 7.0, 8.0], dtype="float").rename("s2")
+
+    feed = DataFeed([s1, s2])
+    feed.compile()
+
+    assert feed.next() == {"s1": 1.0, "s2": 5.0}
+
+    feed.reset(random_start=2)
+
+    assert feed.next() == {"s1": 3.0, "s2": 7.0}
+    assert feed.next() == {"s1": 4.0, "s2": 8.0}
+    assert not feed.has_next()